@@ -5,13 +5,43 @@ Supports unstructured data with intelligent column detection
 Supports Arabic text with proper RTL rendering
 """
 
+import io
+import logging
+import multiprocessing
 import os
-import random
+import queue
+import re
+import sys
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing.util import Finalize
+import numpy as np
 import pandas as pd
-from PIL import Image, ImageDraw, ImageFont
+import PIL
+from PIL import Image, ImageDraw, ImageFont, features
 from arabic_reshaper import reshape
 from bidi.algorithm import get_display
 
+# Optional: python-calamine is a Rust-based Excel reader, much faster than openpyxl
+# (pandas only knows the "calamine" engine from 2.2 on)
+_PANDAS_VERSION = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl)
+
+# Optional: tqdm progress bar while rendering
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+logger = logging.getLogger("feedback")
+logger.addHandler(logging.NullHandler())
+
 # ============================================================================
 # CONFIGURATION - Modify these variables as needed
 # ============================================================================
@@ -26,6 +56,20 @@ FONT_SIZE_FEEDBACK = 42  # Font size for feedback text
 INPUT_EXCEL = "feedback_data.xlsx"  # Input Excel file
 OUTPUT_DIR = "output_cards"  # Directory for generated images
 
+# Output Encoding
+OUTPUT_FORMAT = "PNG"  # "PNG" or "WEBP" (WEBP at method 0 encodes faster)
+PNG_COMPRESS_LEVEL = 1  # zlib level 0-9 (lower = faster encode, larger files)
+PNG_PALETTE_COLORS = 0  # 2-256: save 8-bit palette PNGs (~40% smaller files, slower encode); 0 = full RGB
+WEBP_QUALITY = 90  # WEBP quality 0-100
+
+# Text Shaping
+USE_RAQM = False  # Experimental: shape Arabic with Pillow's Raqm layout (HarfBuzz + FriBiDi) when available
+
+# Performance
+MAX_WORKERS = os.cpu_count() or 1  # Number of worker processes rendering cards
+WRITE_QUEUE_SIZE = 8  # Encoded cards each worker may buffer before waiting on disk
+LOG_LEVEL = logging.INFO  # Set to logging.DEBUG to log every generated card
+
 # Image Dimensions
 IMAGE_WIDTH = 1080  # Fixed width (social media standard)
 CARD_MARGIN = 40  # Margin around the card
@@ -125,6 +169,24 @@ def detect_columns(df):
     return feedback_col, author_col
 
 
+# ============================================================================
+# HELPER FUNCTIONS - Pillow Build Detection
+# ============================================================================
+
+def is_pillow_simd():
+    """
+    Detect whether the installed PIL is the Pillow-SIMD build.
+    
+    Pillow-SIMD is a drop-in replacement for Pillow with SSE4/AVX2 kernels
+    for fills, alpha compositing and resampling. It is published with a
+    ".postN" suffix on top of the upstream Pillow version it tracks.
+    
+    Returns:
+        bool: True if Pillow-SIMD is installed
+    """
+    return ".post" in PIL.__version__
+
+
 # ============================================================================
 # HELPER FUNCTIONS - Font Loading
 # ============================================================================
@@ -140,12 +202,14 @@ def load_font(font_path, size):
     Returns:
         ImageFont object
     """
+    # Raqm must only see logical-order text; reshaped/bidi text needs BASIC layout
+    layout_engine = ImageFont.Layout.RAQM if RAQM_SHAPING else ImageFont.Layout.BASIC
     try:
-        font = ImageFont.truetype(font_path, size)
+        font = ImageFont.truetype(font_path, size, layout_engine=layout_engine)
         return font
     except Exception as e:
-        print(f"[WARNING] Could not load font '{font_path}': {e}")
-        print(f"[WARNING] Falling back to default font")
+        logger.warning("[WARNING] Could not load font '%s': %s", font_path, e)
+        logger.warning("[WARNING] Falling back to default font")
         return ImageFont.load_default()
 
 
@@ -153,13 +217,27 @@ def load_font(font_path, size):
 # HELPER FUNCTIONS - Arabic Text Processing
 # ============================================================================
 
+# Arabic, Arabic Supplement and Arabic Presentation Forms A/B
+# (presentation forms keep already-reshaped text detectable)
+_ARABIC_RE = re.compile(r'[\u0600-\u06ff\u0750-\u077f\ufb50-\ufdff\ufe70-\ufefc]')
+
+# With Raqm, Pillow shapes and reorders text itself (in C) at draw time,
+# so the pure-Python arabic_reshaper/python-bidi pipeline is skipped
+RAQM_SHAPING = USE_RAQM and features.check_feature("raqm")
+
+
 def process_arabic_text(text):
     """
     Process Arabic text for proper RTL rendering.
     
     This function:
-    1. Reshapes Arabic characters to connect them properly
-    2. Applies bidirectional algorithm for RTL display
+    1. Returns text unchanged when Raqm shapes it at draw time
+    2. Returns text without Arabic characters unchanged (fast path)
+    3. Reshapes Arabic characters to connect them properly
+    4. Applies bidirectional algorithm for RTL display
+    
+    Results are memoized per unique string, so repeated authors and
+    duplicate feedback are only shaped once.
     
     Args:
         text: Input text (may contain Arabic)
@@ -170,6 +248,19 @@ def process_arabic_text(text):
     if not text or not isinstance(text, str):
         return ""
     
+    # HarfBuzz/FriBiDi (via Raqm) handle joining and direction when drawing
+    if RAQM_SHAPING:
+        return text
+    
+    return _process_arabic_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _process_arabic_cached(text):
+    # Fast path: plain ASCII / non-Arabic text needs no shaping
+    if text.isascii() or not _ARABIC_RE.search(text):
+        return text
+    
     # Reshape Arabic characters (connects letters properly)
     reshaped_text = reshape(text)
     
@@ -192,44 +283,71 @@ def is_arabic(text):
     if not text:
         return False
     
-    # Check for Arabic Unicode range (0600-06FF)
-    for char in str(text):
-        if '\u0600' <= char <= '\u06FF':
-            return True
-    return False
+    return _is_arabic_cached(str(text))
+
+
+@lru_cache(maxsize=8192)
+def _is_arabic_cached(text):
+    # Single C-level scan for any Arabic codepoint
+    return _ARABIC_RE.search(text) is not None
 
 
 # ============================================================================
 # HELPER FUNCTIONS - Avatar Generation
 # ============================================================================
 
-def generate_avatar(letter, size=80):
+def generate_avatar(letter, size=AVATAR_SIZE):
     """
     Generate a circular letter avatar with pastel background.
     
+    The pastel color is derived from a CRC32 hash of the name, so the same
+    author always gets the same avatar (across runs and worker processes).
+    Avatars are cached per (letter, color, size), so repeated authors
+    only pay for the drawing once.
+    
     Args:
-        letter: First letter of the name
+        letter: Name (or first letter of the name)
         size: Diameter of the avatar in pixels
     
     Returns:
         PIL Image object (RGBA mode for transparency)
     """
-    # Create transparent image
-    avatar = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(avatar)
-    
-    # Choose random pastel color
-    bg_color = random.choice(PASTEL_COLORS)
+    # Choose a stable pastel color for this name
+    color_idx = zlib.crc32(str(letter).encode('utf-8')) % len(PASTEL_COLORS)
     
-    # Draw circle
-    draw.ellipse([0, 0, size, size], fill=bg_color)
+    # Get the first letter (uppercase)
+    letter = str(letter)[0].upper() if letter else "?"
     
-    # Load font for letter (use bold font, larger size)
+    # Hand out a copy so callers can never modify the cached avatar
+    return _render_avatar(letter, color_idx, size).copy()
+
+
+@lru_cache(maxsize=None)
+def _avatar_font(size):
+    # Load font for letter once per size (use bold font, larger size)
     letter_font_size = int(size * 0.5)  # Letter is 50% of avatar size
-    letter_font = load_font(FONT_BOLD_PATH, letter_font_size)
+    return load_font(FONT_BOLD_PATH, letter_font_size)
+
+
+@lru_cache(maxsize=None)
+def _circle_mask(size):
+    # Antialiased circular alpha mask, computed once per size
+    yy, xx = np.ogrid[:size, :size]
+    radius = size / 2
+    distance = np.sqrt((xx - radius + 0.5) ** 2 + (yy - radius + 0.5) ** 2)
+    return np.clip((radius - distance + 0.5) * 255, 0, 255).astype(np.uint8)
+
+
+@lru_cache(maxsize=512)
+def _render_avatar(letter, color_idx, size):
+    # Fill with the pastel color and cut out the circle via the alpha channel
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    pixels[..., :3] = PASTEL_COLORS[color_idx]
+    pixels[..., 3] = _circle_mask(size)
+    avatar = Image.fromarray(pixels)
+    draw = ImageDraw.Draw(avatar)
     
-    # Get the first letter (uppercase)
-    letter = str(letter)[0].upper() if letter else "?"
+    letter_font = _avatar_font(size)
     
     # Process Arabic letter if needed
     if is_arabic(letter):
@@ -253,13 +371,68 @@ def generate_avatar(letter, size=80):
 # HELPER FUNCTIONS - Text Wrapping
 # ============================================================================
 
+def ascii_width_table(font):
+    """
+    Get the advance widths of the printable ASCII characters for a font.
+    
+    The table is built on first use and stored on the font object, so
+    every later ASCII measurement is a plain list lookup.
+    
+    Args:
+        font: ImageFont object
+    
+    Returns:
+        List of widths indexed by ord(char) - 32 (space to '~')
+    """
+    table = getattr(font, "_ascii_widths", None)
+    if table is None:
+        table = [font.getlength(chr(code)) for code in range(32, 127)]
+        font._ascii_widths = table
+    return table
+
+
+def measure_word(font, word):
+    """
+    Measure the pixel width of a single word.
+    
+    Printable ASCII words are summed from the font's width table; anything
+    else (Arabic, accents, control characters) is measured by FreeType.
+    
+    Args:
+        font: ImageFont object
+        word: Word to measure (no spaces)
+    
+    Returns:
+        Width in pixels
+    """
+    if word.isascii() and word.isprintable():
+        table = ascii_width_table(font)
+        return sum(table[ord(char) - 32] for char in word)
+    return font.getlength(word)
+
+
+@lru_cache(maxsize=None)
+def line_height(font):
+    """
+    Get the height of one line of text for a font (measured once per font).
+    
+    Args:
+        font: ImageFont object
+    
+    Returns:
+        Line height in pixels
+    """
+    bbox = font.getbbox("Ay")
+    return bbox[3] - bbox[1]
+
+
 def wrap_text(text, font, max_width):
     """
     Wrap text into multiple lines to fit within max_width.
     
     Algorithm:
-    1. Split text into words
-    2. Build lines by adding words until width exceeds max_width
+    1. Split text into words and measure each word (and a space) once
+    2. Build lines by summing word widths until they exceed max_width
     3. When a line is full, start a new line
     4. Handle edge case: if a single word is too long, force it on its own line
     
@@ -273,76 +446,156 @@ def wrap_text(text, font, max_width):
     """
     words = text.split()
     lines = []
-    current_line = ""
     
-    for word in words:
-        # Test if adding this word would exceed max width
-        test_line = f"{current_line} {word}".strip()
-        
-        # Get bounding box to measure text width
-        bbox = font.getbbox(test_line)
-        text_width = bbox[2] - bbox[0]
+    # Measure each word once instead of re-measuring every growing line
+    space_width = font.getlength(" ")
+    word_widths = [measure_word(font, word) for word in words]
+    
+    current_line = []
+    current_width = 0
+    
+    for word, word_width in zip(words, word_widths):
+        # Width of the current line if this word is added
+        test_width = current_width + space_width + word_width if current_line else word_width
         
-        if text_width <= max_width:
+        if test_width <= max_width:
             # Word fits, add it to current line
-            current_line = test_line
+            current_line.append(word)
+            current_width = test_width
+        elif current_line:
+            # Word doesn't fit: save current line and start new one with this word
+            lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_width
         else:
-            # Word doesn't fit
-            if current_line:
-                # Save current line and start new one with this word
-                lines.append(current_line)
-                current_line = word
-            else:
-                # Edge case: single word is too long, force it anyway
-                lines.append(word)
-                current_line = ""
+            # Edge case: single word is too long, force it anyway
+            lines.append(word)
     
     # Don't forget the last line
     if current_line:
-        lines.append(current_line)
+        lines.append(" ".join(current_line))
     
     return lines
 
 
 # ============================================================================
-# HELPER FUNCTIONS - Drawing
+# HELPER FUNCTIONS - Output Format
 # ============================================================================
 
-def draw_rounded_rectangle(draw, xy, radius, fill):
+SUPPORTED_OUTPUT_FORMATS = ("PNG", "WEBP")
+
+
+def get_output_format():
+    """
+    Get OUTPUT_FORMAT normalized to upper case (e.g. "webp" -> "WEBP").
+    
+    Returns:
+        str: Normalized output format name
+    """
+    return str(OUTPUT_FORMAT).strip().upper()
+
+
+# ============================================================================
+# HELPER FUNCTIONS - Card Template
+# ============================================================================
+
+def rounded_rect_mask(width, height, radius):
     """
-    Draw a rounded rectangle.
+    Build an antialiased rounded-rectangle alpha mask with NumPy.
+    
+    Only one corner is rasterized; the other three are mirrored copies.
     
     Args:
-        draw: ImageDraw object
-        xy: Tuple of (x1, y1, x2, y2) coordinates
-        radius: Corner radius
-        fill: Fill color
+        width: Mask width in pixels
+        height: Mask height in pixels
+        radius: Corner radius in pixels
+    
+    Returns:
+        PIL Image object (L mode)
     """
-    x1, y1, x2, y2 = xy
+    mask = np.full((height, width), 255, dtype=np.uint8)
+    
+    # Corners can't overlap; a zero radius is a plain rectangle
+    radius = min(radius, width // 2, height // 2)
+    if radius <= 0:
+        return Image.fromarray(mask)
     
-    # Draw main rectangle
-    draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-    draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
+    # Top-left corner: coverage of each pixel by the corner circle
+    yy, xx = np.ogrid[:radius, :radius]
+    distance = np.sqrt((radius - xx - 0.5) ** 2 + (radius - yy - 0.5) ** 2)
+    corner = np.clip((radius - distance + 0.5) * 255, 0, 255).astype(np.uint8)
     
-    # Draw four corners
-    draw.pieslice([x1, y1, x1 + radius * 2, y1 + radius * 2], 180, 270, fill=fill)
-    draw.pieslice([x2 - radius * 2, y1, x2, y1 + radius * 2], 270, 360, fill=fill)
-    draw.pieslice([x1, y2 - radius * 2, x1 + radius * 2, y2], 90, 180, fill=fill)
-    draw.pieslice([x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=fill)
+    mask[:radius, :radius] = corner
+    mask[:radius, width - radius:] = corner[:, ::-1]
+    mask[height - radius:, :radius] = corner[::-1, :]
+    mask[height - radius:, width - radius:] = corner[::-1, ::-1]
+    
+    return Image.fromarray(mask)
+
+
+@lru_cache(maxsize=32)
+def card_template(image_height):
+    """
+    Render the empty card (background + rounded rectangle) for a given height.
+    
+    Card height only depends on the number of wrapped feedback lines, so
+    most rows reuse a template; callers must .copy() it before drawing on it.
+    
+    Args:
+        image_height: Total image height in pixels
+    
+    Returns:
+        PIL Image object (RGB mode)
+    """
+    # Create image with background
+    image = Image.new('RGB', (IMAGE_WIDTH, image_height), BACKGROUND_COLOR)
+    
+    # Blit the card (rounded rectangle) through an antialiased mask
+    card_x1 = CARD_MARGIN
+    card_x2 = IMAGE_WIDTH - CARD_MARGIN
+    card_y1 = CARD_MARGIN
+    card_y2 = image_height - CARD_MARGIN
+    mask = rounded_rect_mask(card_x2 - card_x1 + 1, card_y2 - card_y1 + 1, CARD_RADIUS)
+    image.paste(CARD_COLOR, (card_x1, card_y1), mask)
+    
+    return image
 
 
 # ============================================================================
 # MAIN IMAGE GENERATION
 # ============================================================================
 
-def generate_premium_card(feedback_text, author_name, output_path, font_bold, font_regular):
+def prepare_card_job(feedback_text, author_name, output_path):
     """
-    Generate a premium card image with avatar, author name, and feedback text.
+    Prepare everything about a card that does not depend on the fonts.
+    
+    Arabic processing and RTL detection run once per row here (inside the
+    worker process, so shaping is parallelized with rendering), and
+    generate_premium_card never re-processes text.
     
     Args:
         feedback_text: Feedback text to render
         author_name: Author's name
         output_path: Path to save the image
+    
+    Returns:
+        dict: Picklable card job for generate_premium_card
+    """
+    return {
+        "feedback": process_arabic_text(feedback_text),
+        "author": process_arabic_text(author_name) if author_name else "Anonymous",
+        "avatar_name": author_name if author_name else "A",
+        "is_rtl": is_arabic(feedback_text) or is_arabic(author_name),
+        "output_path": output_path,
+    }
+
+
+def generate_premium_card(job, font_bold, font_regular):
+    """
+    Generate a premium card image with avatar, author name, and feedback text.
+    
+    Args:
+        job: Card job from prepare_card_job
         font_bold: Bold font for author name
         font_regular: Regular font for feedback text
     
@@ -350,12 +603,10 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
         True if successful, False otherwise
     """
     try:
-        # Process text for Arabic support
-        processed_feedback = process_arabic_text(feedback_text)
-        processed_author = process_arabic_text(author_name) if author_name else "Anonymous"
-        
-        # Detect if text is RTL (Arabic)
-        is_rtl = is_arabic(feedback_text) or is_arabic(author_name)
+        processed_feedback = job["feedback"]
+        processed_author = job["author"]
+        is_rtl = job["is_rtl"]
+        output_path = job["output_path"]
         
         # Calculate card dimensions
         card_width = IMAGE_WIDTH - (CARD_MARGIN * 2)
@@ -368,12 +619,12 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
         # Wrap feedback text
         feedback_lines = wrap_text(processed_feedback, font_regular, max_text_width)
         
-        # Calculate heights
+        # Measure author name once (width for RTL placement, height for layout)
         author_bbox = font_bold.getbbox(processed_author)
+        author_width = author_bbox[2] - author_bbox[0]
         author_height = author_bbox[3] - author_bbox[1]
         
-        feedback_bbox = font_regular.getbbox("Ay")
-        feedback_line_height = feedback_bbox[3] - feedback_bbox[1]
+        feedback_line_height = line_height(font_regular)
         
         # Header height (avatar or author name, whichever is taller)
         header_height = max(AVATAR_SIZE, author_height)
@@ -388,17 +639,12 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
         # Calculate image height
         image_height = card_height + (CARD_MARGIN * 2)
         
-        # Create image with background
-        image = Image.new('RGB', (IMAGE_WIDTH, image_height), BACKGROUND_COLOR)
+        # Start from a copy of the pre-rendered background + card
+        image = card_template(image_height).copy()
         draw = ImageDraw.Draw(image)
         
-        # Draw card (rounded rectangle)
-        card_y1 = CARD_MARGIN
-        card_y2 = image_height - CARD_MARGIN
-        draw_rounded_rectangle(draw, (card_x1, card_y1, card_x2, card_y2), CARD_RADIUS, CARD_COLOR)
-        
         # Generate and position avatar
-        avatar = generate_avatar(author_name if author_name else "A", AVATAR_SIZE)
+        avatar = generate_avatar(job["avatar_name"], AVATAR_SIZE)
         
         # Calculate header positions
         current_y = CARD_MARGIN + CARD_PADDING
@@ -409,8 +655,6 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
             image.paste(avatar, (avatar_x, current_y), avatar)
             
             # Author name to the left of avatar
-            author_bbox = font_bold.getbbox(processed_author)
-            author_width = author_bbox[2] - author_bbox[0]
             author_x = avatar_x - AVATAR_NAME_SPACING - author_width
             author_y = current_y + (AVATAR_SIZE - author_height) // 2  # Vertically center with avatar
             draw.text((author_x, author_y), processed_author, font=font_bold, fill=TEXT_COLOR_AUTHOR)
@@ -429,12 +673,10 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
         
         # Draw feedback text
         for line in feedback_lines:
-            # Get text width for alignment
-            bbox = font_regular.getbbox(line)
-            text_width = bbox[2] - bbox[0]
-            
             if is_rtl:
-                # Right-aligned for RTL
+                # Right-aligned for RTL (only RTL needs the text width)
+                bbox = font_regular.getbbox(line)
+                text_width = bbox[2] - bbox[0]
                 text_x = card_x2 - CARD_PADDING - text_width
             else:
                 # Left-aligned for LTR
@@ -443,15 +685,158 @@ def generate_premium_card(feedback_text, author_name, output_path, font_bold, fo
             draw.text((text_x, current_y), line, font=font_regular, fill=TEXT_COLOR_FEEDBACK)
             current_y += feedback_line_height + LINE_SPACING
         
-        # Save image
-        image.save(output_path, 'PNG', quality=95)
+        # Encode image (file is written by the background writer, if running)
+        buffer = io.BytesIO()
+        if get_output_format() == "WEBP":
+            image.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=0)
+        else:
+            if PNG_PALETTE_COLORS:
+                # Cards use few colors; median cut keeps the flat design colors exact
+                image = image.quantize(colors=PNG_PALETTE_COLORS, method=Image.Quantize.MEDIANCUT)
+            image.save(buffer, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+        write_card(output_path, buffer.getbuffer())
         return True
         
     except Exception as e:
-        print(f"[ERROR] Error generating card: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] Error generating card: %s", e)
+        return False
+
+
+# ============================================================================
+# BACKGROUND FILE WRITER
+# ============================================================================
+
+# Queue + thread owning file I/O in the current process (set by start_writer)
+_write_queue = None
+_write_thread = None
+
+
+def _writer_loop(write_queue, failure_queue):
+    """
+    Write queued (output_path, data) items to disk until a None sentinel.
+    
+    Paths that could not be written are put on failure_queue (if given).
+    Any error is caught so the thread never dies with the queue still in use.
+    """
+    while (item := write_queue.get()) is not None:
+        output_path, data = item
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            logger.error("[ERROR] Could not write %s: %s", output_path, e)
+            if failure_queue is not None:
+                failure_queue.put(output_path)
+
+
+def start_writer(failure_queue=None):
+    """
+    Start a background thread that writes encoded cards to disk.
+    
+    This lets the render loop start on the next card while the previous one
+    is still being written. The writer is drained and joined automatically
+    when the process exits.
+    
+    Args:
+        failure_queue: Optional multiprocessing.Queue receiving failed output paths
+    """
+    global _write_queue, _write_thread
+    if _write_thread is not None:
+        return
+    _write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    _write_thread = threading.Thread(target=_writer_loop, args=(_write_queue, failure_queue),
+                                     name="card-writer")
+    _write_thread.start()
+    Finalize(None, stop_writer, exitpriority=100)
+
+
+def stop_writer():
+    """
+    Flush all pending writes and stop the background writer thread.
+    """
+    global _write_queue, _write_thread
+    if _write_thread is None:
+        return
+    _write_queue.put(None)
+    _write_thread.join()
+    _write_queue = None
+    _write_thread = None
+
+
+def _collect_write_failures(failure_queue, failed_paths):
+    """
+    Gather failed output paths from the workers' writers until a None sentinel.
+    """
+    while (output_path := failure_queue.get()) is not None:
+        failed_paths.add(output_path)
+
+
+def write_card(output_path, data):
+    """
+    Write an encoded card, through the background writer when it is running.
+    
+    Args:
+        output_path: Path to save the image
+        data: Encoded image bytes
+    """
+    if _write_queue is not None:
+        _write_queue.put((output_path, data))
+    else:
+        with open(output_path, 'wb') as f:
+            f.write(data)
+
+
+# ============================================================================
+# PARALLEL RENDERING
+# ============================================================================
+
+def configure_logging():
+    """
+    Send log records to stdout as plain messages (no-op if already configured).
+    """
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s", stream=sys.stdout)
+
+
+# Fonts owned by the current worker process (set by _init_worker).
+# ImageFont objects cannot be pickled, so each worker loads its own copy.
+_worker_font_bold = None
+_worker_font_regular = None
+
+
+def _init_worker(bold_path, bold_size, regular_path, regular_size, failure_queue):
+    """
+    Load the card fonts and start the file writer once per worker process.
+    
+    Args:
+        bold_path: Path to the bold .ttf font file
+        bold_size: Bold font size in pixels
+        regular_path: Path to the regular .ttf font file
+        regular_size: Regular font size in pixels
+        failure_queue: multiprocessing.Queue receiving paths the writer failed on
+    """
+    global _worker_font_bold, _worker_font_regular
+    configure_logging()
+    start_writer(failure_queue)
+    _worker_font_bold = load_font(bold_path, bold_size)
+    _worker_font_regular = load_font(regular_path, regular_size)
+
+
+def _render_row(args):
+    """
+    Prepare and render a single card inside a worker process.
+    
+    Args:
+        args: Tuple of (feedback_text, author_name, output_path)
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        job = prepare_card_job(*args)
+    except Exception as e:
+        logger.exception("[ERROR] Error preparing card: %s", e)
         return False
+    return generate_premium_card(job, _worker_font_bold, _worker_font_regular)
 
 
 # ============================================================================
@@ -462,13 +847,44 @@ def main():
     """
     Main function to process Excel file and generate premium cards.
     """
+    configure_logging()
+    
     print("=" * 60)
     print("Feedback Visualizer - Premium Card Edition")
     print("=" * 60)
     
-    # Load fonts
-    font_bold = load_font(FONT_BOLD_PATH, FONT_SIZE_AUTHOR)
-    font_regular = load_font(FONT_REGULAR_PATH, FONT_SIZE_FEEDBACK)
+    # Report which Pillow build is doing the rendering
+    if is_pillow_simd():
+        print(f"[OK] Pillow-SIMD {PIL.__version__} detected")
+    else:
+        print(f"[INFO] Using standard Pillow {PIL.__version__} (install pillow-simd for faster rendering)")
+    
+    if RAQM_SHAPING:
+        print("[OK] Arabic shaping: Raqm (HarfBuzz + FriBiDi)")
+    else:
+        reason = "Raqm not available" if USE_RAQM else "USE_RAQM disabled"
+        print(f"[INFO] Arabic shaping: arabic-reshaper + python-bidi ({reason})")
+    
+    # Validate the output format once instead of failing on every row
+    output_format = get_output_format()
+    if output_format not in SUPPORTED_OUTPUT_FORMATS:
+        print(f"\n[ERROR] Unsupported OUTPUT_FORMAT '{OUTPUT_FORMAT}'!")
+        print(f"  Supported formats: {', '.join(SUPPORTED_OUTPUT_FORMATS)}")
+        return
+    if output_format == "WEBP" and not features.check("webp"):
+        print("\n[ERROR] This Pillow build has no WEBP support!")
+        print("  Set OUTPUT_FORMAT = \"PNG\" or install a Pillow build with libwebp.")
+        return
+    if (not isinstance(PNG_PALETTE_COLORS, int) or isinstance(PNG_PALETTE_COLORS, bool)
+            or PNG_PALETTE_COLORS != 0 and not 2 <= PNG_PALETTE_COLORS <= 256):
+        print(f"\n[ERROR] Invalid PNG_PALETTE_COLORS {PNG_PALETTE_COLORS!r}!")
+        print("  Use 0 for full RGB or a color count from 2 to 256.")
+        return
+    print(f"[OK] Output format: {output_format}")
+    
+    # Check fonts up front (each worker process loads its own copy)
+    load_font(FONT_BOLD_PATH, FONT_SIZE_AUTHOR)
+    load_font(FONT_REGULAR_PATH, FONT_SIZE_FEEDBACK)
     print(f"[OK] Fonts loaded")
     
     # Check if input file exists
@@ -483,8 +899,8 @@ def main():
     
     # Read Excel file
     try:
-        df = pd.read_excel(INPUT_EXCEL)
-        print(f"[OK] Loaded Excel file: {INPUT_EXCEL}")
+        df = pd.read_excel(INPUT_EXCEL, engine=EXCEL_ENGINE)
+        print(f"[OK] Loaded Excel file: {INPUT_EXCEL} (engine: {EXCEL_ENGINE or 'openpyxl'})")
         print(f"  Total rows: {len(df)}")
         print(f"  Columns: {', '.join(df.columns)}")
     except Exception as e:
@@ -502,18 +918,25 @@ def main():
     print("Generating premium cards...")
     print("-" * 60)
     
-    # Process each row
+    # Collect render tasks for each row (jobs are prepared in the workers)
     success_count = 0
     skip_count = 0
+    tasks = []
+    task_rows = []
     
-    for index, row in df.iterrows():
-        feedback_text = row[feedback_col]
-        author_name = row[author_col] if author_col and author_col in row else "Anonymous"
-        
+    # Pull the two columns out once instead of building a Series per row
+    feedback_series = df[feedback_col]
+    feedback_values = feedback_series.to_numpy()
+    author_values = df[author_col].to_numpy() if author_col else [None] * len(df)
+    
+    # Vectorized empty-feedback mask
+    has_feedback = (feedback_series.notna() & (feedback_series.astype(str).str.strip() != "")).to_numpy()
+    
+    for index, (feedback_text, author_name) in enumerate(zip(feedback_values, author_values)):
         # Skip empty rows
-        if pd.isna(feedback_text) or str(feedback_text).strip() == "":
+        if not has_feedback[index]:
             skip_count += 1
-            print(f"[SKIP] Row {index + 1}: Skipped (empty feedback)")
+            logger.debug("[SKIP] Row %d: Skipped (empty feedback)", index + 1)
             continue
         
         # Handle missing author name
@@ -521,15 +944,48 @@ def main():
             author_name = "Anonymous"
         
         # Generate output filename (1-indexed to match row numbers)
-        output_filename = f"feedback_card_{index + 1}.png"
+        output_filename = f"feedback_card_{index + 1}.{output_format.lower()}"
         output_path = os.path.join(OUTPUT_DIR, output_filename)
         
-        # Generate card
-        if generate_premium_card(str(feedback_text), str(author_name), output_path, font_bold, font_regular):
+        tasks.append((str(feedback_text), str(author_name), output_path))
+        task_rows.append((index, output_filename))
+    
+    # Generate cards in parallel (each card is independent)
+    workers = max(1, min(MAX_WORKERS, len(tasks)))
+    if sys.platform == "win32":
+        # ProcessPoolExecutor rejects more than 61 workers on Windows
+        workers = min(workers, 61)
+    chunksize = max(1, len(tasks) // (workers * 4))
+    
+    # Cards are written by background threads in the workers, so write
+    # failures are reported back separately (drained while the pool runs)
+    write_failures = multiprocessing.Queue()
+    failed_paths = set()
+    collector = threading.Thread(target=_collect_write_failures,
+                                 args=(write_failures, failed_paths), daemon=True)
+    collector.start()
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(FONT_BOLD_PATH, FONT_SIZE_AUTHOR,
+                                           FONT_REGULAR_PATH, FONT_SIZE_FEEDBACK,
+                                           write_failures)) as executor:
+            results = executor.map(_render_row, tasks, chunksize=chunksize)
+            if tqdm is not None:
+                results = tqdm(results, total=len(tasks), desc="Rendering", unit="card")
+            results = list(results)
+    finally:
+        # Workers have exited (and flushed their writers); stop the collector
+        # even if the pool broke or the run was interrupted
+        write_failures.put(None)
+        collector.join()
+    
+    for (index, output_filename), (_, _, output_path), ok in zip(task_rows, tasks, results):
+        if ok and output_path not in failed_paths:
             success_count += 1
-            print(f"[OK] Row {index + 1}: Generated {output_filename}")
+            logger.debug("[OK] Row %d: Generated %s", index + 1, output_filename)
         else:
-            print(f"[ERROR] Row {index + 1}: Failed to generate {output_filename}")
+            logger.error("[ERROR] Row %d: Failed to generate %s", index + 1, output_filename)
     
     # Summary
     print("-" * 60)